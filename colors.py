@@ -2,31 +2,40 @@
 # colors.py
 # A bunch of color constants for importing
 
-from pygame import Color
+# Plain tuples instead of pygame.Color objects: every pygame call
+# accepts them, they don't need a C allocation each, and fill/render
+# take a faster parsing path for tuples than for Color instances.
 
 
 class RGBA:
-    TRANSPARENT = Color(255, 255, 255, 0)
+    TRANSPARENT = (255, 255, 255, 0)
 
 
 class RGB:
-    WHITE = Color(255, 255, 255)
-    BLACK = Color(0, 0, 0)
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
 
-    RED = Color(255, 0, 0)
-    GREEN = Color(0, 255, 0)
-    BLUE = Color(0, 0, 255)
+    RED = (255, 0, 0)
+    GREEN = (0, 255, 0)
+    BLUE = (0, 0, 255)
 
-    YELLOW = Color(255, 255, 0)
-    LIGHT_BLUE = Color(0, 255, 255)
-    PINK = Color(255, 0, 255)
+    YELLOW = (255, 255, 0)
+    LIGHT_BLUE = (0, 255, 255)
+    PINK = (255, 0, 255)
 
 
 # these ones are out here cause theyre independent of rgb(a)
-# Color(225, 63, 240, 128)
+# (225, 63, 240, 128)
 MENU_BACKGROUND = RGB.WHITE
-MENU_HIGHLIGHTED = Color(240, 204, 86, 128)
+MENU_HIGHLIGHTED = (240, 204, 86, 128)
 
 if __name__ == "__main__":
     # Print defined colours
     print("Hey you should import this, not just run it!")
+
+    # vars() instead of dir() + eval shenanigans: no compiler involved
+    for group in (RGB, RGBA):
+        print(f"-- {group.__name__}")
+        for name, value in vars(group).items():
+            if not name.startswith("__"):
+                print(f"{name}\t{value}")
@@ -1,10 +1,36 @@
-import pygame
-from pygame.font import init, SysFont, get_default_font
+from functools import lru_cache
+
+from pygame.font import init, Font, SysFont
 
 # Start fonts. It's necessary
 init()
-TITLE = SysFont("Arial", 64)
-BIG_MENU = SysFont("Arial", 34)
 
-HEALTHBAR = SysFont("Helvetica", 28)
-DEFAULT = SysFont("Arial", 24)
+# Creating a SysFont hits the system font config, which adds up at
+# import time. The specs live here and the actual Font objects are
+# only built on first access through the module __getattr__ (PEP 562).
+_SPECS = {
+    "TITLE": ("Arial", 64),
+    "BIG_MENU": ("Arial", 34),
+    "HEALTHBAR": ("Helvetica", 28),
+    "DEFAULT": ("Arial", 24),
+}
+
+
+@lru_cache(maxsize=16)
+def get_font(name: str, size: int) -> Font:
+    """
+    One Font object per (name, size), shared by everyone who asks.
+    Repeated SysFont calls would each open the font file and keep their
+    own glyph cache.
+    :param name: System font name
+    :param size: Point size
+    :return: pygame Font
+    """
+    return SysFont(name, size)
+
+
+def __getattr__(name: str):
+    if name in _SPECS:
+        return get_font(*_SPECS[name])
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
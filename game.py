@@ -10,7 +10,7 @@ import colors
 import fonts
 import game_objects
 import scenes
-from game_objects import screen_size, GameStatus, Enemy, Weapon, Status, Item
+from game_objects import SCREEN_SIZE, GameStatus, Enemy, Weapon, Status, Item
 
 # Global imports
 import os
@@ -50,25 +50,32 @@ def load_weapon(data: dict, folder: str) -> Weapon:
 
 def load_objects(folder: str) -> tuple:
 
-    folders = [
-        f for f in os.listdir(folder) if os.path.isdir(os.path.join(folder, f))
-    ]
-    print(os.listdir(folder))
+    # scandir's DirEntry already knows whether an entry is a directory,
+    # so this doesn't stat() every entry like listdir + isdir would.
+    # The entries also carry their joined path, saving the path.join
+    # calls below.
+    with os.scandir(folder) as entries:
+        folders = [e for e in entries if e.is_dir()]
+    print([e.name for e in folders])
     types = {"enemy": load_enemy, "weapon": load_weapon}
 
     objects = list()
 
     for obj in folders:
-        with open(os.path.join(folder, obj, "data.json")) as file:
+        with open(os.path.join(obj.path, "data.json")) as file:
             data = json.load(file)
 
-        objects.append(types[data["type"]](data, os.path.join(folder, obj)))
+        objects.append(types[data["type"]](data, obj.path))
 
     return tuple(objects)
 
 
 # --
 
+# Menu movement dispatch: one dict lookup per keypress instead of a
+# chain of equality checks
+_MENU_DELTA = {pygame.K_UP: -1, pygame.K_DOWN: 1}
+
 
 def main():
     """
@@ -88,11 +95,23 @@ def main():
     # Start up pygame
     pygame.init()
     pygame.font.init()
+
+    # Only two event types are ever handled, so block the rest (mouse
+    # motion especially) at the SDL queue instead of filtering them in
+    # the event loop
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
     clock = pygame.time.Clock()
 
     # Also creating a tuple because some functions take that
-    size = width, height = screen_size()
-    screen = pygame.display.set_mode(size, vsync=1, flags=pygame.SRCALPHA)
+    size = width, height = SCREEN_SIZE
+    # No SRCALPHA here: the display can't usefully have per-pixel alpha
+    # and the flag would push every blit onto the alpha-blending path.
+    # Surfaces that need alpha (menus) create it for themselves.
+    # No vsync either; clock.tick already paces the loop and blocking
+    # on the blank interval as well just adds waiting
+    screen = pygame.display.set_mode(size)
     pygame.display.set_caption("Dental Guardians")
 
     all_scenes = scenes.generate_scenes()
@@ -109,150 +128,205 @@ def main():
     # For handling changing stuff after while
     start_time = 0
 
-    playing = True
-    while playing:
-        active_scene = all_scenes.get(status.status, None)
+    # -- Per-status handlers
+    # One callable per status, looked up from a dict each frame, which
+    # replaces walking an if/elif chain of identity checks. Statuses
+    # with no per-frame work (title screen, credits) simply have no
+    # entry.
+    def handle_battle_start(active_scene):
+        nonlocal start_time
+
+        # Pick enemy
+        if active_scene.enemy.object is None:
+            active_scene.enemy.object = choice(enemies)
+
+        # Reset this to 0 so it goes back to what the static menu shows
+        all_scenes[GameStatus.BATTLE_MENU].menu.object.current_option = 0
+
+        active_scene.statics["info_box"].object.set_text(
+            f"{active_scene.enemy.object.name} challenges you!"
+        )
+
+        # Theres probably a way to do this with async but idk how to use that.
+        # Go to next animation after a sec
+        # Needs nested if so the else doesnt reset the start time
+        if start_time:
+            if time() - start_time > TIME:
+                start_time = 0
+                status.update(GameStatus.BATTLE_MENU)
+        else:
+            start_time = time()
+
+    def handle_battle_menu(active_scene):
+        active_scene.statics["info_box"].object.set_text(str(player))
+
+    def handle_weapon_menu(active_scene):
+        # Set options
+        # The player hands back the same dict object until the
+        # inventory changes, so comparing identity skips reassigning
+        # (and re-rendering all the labels) on every frame
+        menu = active_scene.menu.object
+        if menu.options is not player.weapon_options:
+            menu.options = player.weapon_options
+
+    def handle_item_menu(active_scene):
+        # Set weapons.
+        menu = active_scene.menu.object
+        if menu.options is not player.item_options:
+            menu.options = player.item_options
+
+    def handle_player_attack(active_scene):
+        nonlocal start_time
+
+        if start_time:
+            if time() - start_time > TIME:
+                start_time = 0
+
+                if active_scene.enemy.object.hp <= 0:
+                    status.update(GameStatus.VICTORY)
+                else:
+                    status.update(GameStatus.ENEMY_ATTACK)
 
-        # Reset screen
-        screen.fill(colors.RGB.WHITE)
+        else:
+            start_time = time()
+            damage_taken = active_scene.enemy.object.take_damage(
+                status.weapon
+            )
+            active_scene.statics["info_box"].object.set_text(
+                f"You attacked {active_scene.enemy.object.name} with {status.weapon.name} "
+                f"and dealt {damage_taken} damage!"
+            )
+            del damage_taken
 
-        # This would be so nice with a switch case (match)
-        # -- Game statuses
-        # - Nothing to do for TITLE_SCREEN
-        # Start battle
-        if status.status is GameStatus.BATTLE_START:
-            # assert isinstance(active_scene, scenes.BattleScene), (
-            #     f"{status.status} scene is {type(active_scene)} "
-            #     f"not {type(scenes.BattleScene)}"
-            # )
-            # Pick enemy
-            if active_scene.enemy.object is None:
-                active_scene.enemy.object = choice(enemies)
-
-            # Reset this to 0 so it goes back to what the static menu shows
-            all_scenes[GameStatus.BATTLE_MENU].menu.object.current_option = 0
+    def handle_use_item(active_scene):
+        nonlocal start_time
+
+        if start_time:
+            if time() - start_time > TIME:
+                start_time = 0
+                status.update(GameStatus.ENEMY_ATTACK)
+        else:
+            start_time = time()
 
             active_scene.statics["info_box"].object.set_text(
-                f"{active_scene.enemy.object.name} challenges you!"
+                f"You use {status.item.name} "
+                f"and gain {itemtype_names[status.item.type]}!"
             )
+            player.use(status.item)
+
+    def handle_enemy_attack(active_scene):
+        nonlocal start_time
+
+        if start_time:
+            if time() - start_time > TIME:
+                start_time = 0
 
-            # Theres probably a way to do this with async but idk how to use that.
-            # Go to next animation after a sec
-            # Needs nested if so the else doesnt reset the start time
-            if start_time:
-                if time() - start_time > TIME:
-                    start_time = 0
+                if player.hp <= 0:
+                    status.update(GameStatus.DEFEAT)
+                else:
                     status.update(GameStatus.BATTLE_MENU)
-            else:
-                start_time = time()
-
-        elif status.status is GameStatus.BATTLE_MENU:
-            active_scene.statics["info_box"].object.set_text(str(player))
-
-        elif status.status is GameStatus.WEAPON_MENU:
-            # Set options
-            if not active_scene.menu.object.options:
-                active_scene.menu.object.options = {
-                    weapon.name: weapon
-                    for weapon in player.weapons
-                    if weapon is not None
-                }
-                active_scene.menu.object.options[
-                    "Back"
-                ] = GameStatus.BATTLE_MENU
-
-        elif status.status is GameStatus.ITEM_MENU:
-            # Set weapons.
-            if not active_scene.menu.object.options:
-                active_scene.menu.object.options = {
-                    item.name: item
-                    for item in player.items
-                    if item is not None
-                }
-                active_scene.menu.object.options[
-                    "Back"
-                ] = GameStatus.BATTLE_MENU
-
-        elif status.status is GameStatus.PLAYER_ATTACK:
-
-            if start_time:
-                if time() - start_time > TIME:
-                    start_time = 0
-
-                    if active_scene.enemy.object.hp <= 0:
-                        status.update(GameStatus.VICTORY)
-                    else:
-                        status.update(GameStatus.ENEMY_ATTACK)
+        # This part will only run once
+        else:
+            start_time = time()
 
-            else:
-                start_time = time()
-                damage_taken = active_scene.enemy.object.take_damage(
-                    status.weapon
-                )
-                active_scene.statics["info_box"].object.set_text(
-                    f"You attacked {active_scene.enemy.object.name} with {status.weapon.name} "
-                    f"and dealt {damage_taken} damage!"
-                )
-                del damage_taken
-
-        elif status.status is GameStatus.USE_ITEM:
-            if start_time:
-                if time() - start_time > TIME:
-                    start_time = 0
-                    status.update(GameStatus.ENEMY_ATTACK)
-            else:
-                start_time = time()
-
-                active_scene.statics["info_box"].object.set_text(
-                    f"You use {status.item.name} "
-                    f"and gain {itemtype_names[status.item.type]}!"
-                )
-                player.use(status.item)
-
-        elif status.status is GameStatus.ENEMY_ATTACK:
-            if start_time:
-                if time() - start_time > TIME:
-                    start_time = 0
-
-                    if player.hp <= 0:
-                        status.update(GameStatus.DEFEAT)
-                    else:
-                        status.update(GameStatus.BATTLE_MENU)
-            # This part will only run once
-            else:
-                start_time = time()
+            damage_taken = player.take_damage(
+                active_scene.enemy.object.get_damage()
+            )
+
+            active_scene.statics["info_box"].object.set_text(
+                f"{active_scene.enemy.object.name} attacked you "
+                f"and dealt {damage_taken} damage!"
+            )
+
+    def handle_exit(active_scene):
+        nonlocal playing
+        playing = False
+
+    handlers = {
+        GameStatus.BATTLE_START: handle_battle_start,
+        GameStatus.BATTLE_MENU: handle_battle_menu,
+        GameStatus.WEAPON_MENU: handle_weapon_menu,
+        GameStatus.ITEM_MENU: handle_item_menu,
+        GameStatus.PLAYER_ATTACK: handle_player_attack,
+        GameStatus.USE_ITEM: handle_use_item,
+        GameStatus.ENEMY_ATTACK: handle_enemy_attack,
+        GameStatus.EXIT: handle_exit,
+    }
+    # --
+
+    # Every attribute access in the loop costs a dict lookup, so bind
+    # the invariant ones to locals once. LOAD_FAST beats LOAD_ATTR.
+    event_get = pygame.event.get
+    flip = pygame.display.flip
+    tick = clock.tick
+    fill = screen.fill
+    blit = screen.blit
 
-                damage_taken = player.take_damage(
-                    active_scene.enemy.object.get_damage()
-                )
+    WHITE = colors.RGB.WHITE
 
-                active_scene.statics["info_box"].object.set_text(
-                    f"{active_scene.enemy.object.name} attacked you "
-                    f"and dealt {damage_taken} damage!"
-                )
+    QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+    K_SPACE, K_RETURN = pygame.K_SPACE, pygame.K_RETURN
+    menu_delta = _MENU_DELTA
+    scene_get = all_scenes.get
+    handler_get = handlers.get
 
-        elif status.status is GameStatus.EXIT:
-            playing = False
+    # The scene cache returns the same surface object while nothing
+    # changed, so comparing identities tells us if this frame is new
+    last_frame = None
 
-        if (active_scene := all_scenes.get(status.status, None)) is not None:
-            screen.blit(active_scene.get_surface(status.status), (0, 0))
+    playing = True
+    while playing:
+        current_status = status.status
+        active_scene = scene_get(current_status, None)
+
+        # -- Game statuses
+        # Scene types are checked once in generate_scenes, so no
+        # per-frame isinstance needed in the handlers
+        if (handler := handler_get(current_status)) is not None:
+            handler(active_scene)
+
+        # Handlers can move the status along (the timed battle
+        # transitions), and the frame should show the new state right
+        # away -- but only then is a second scene lookup needed
+        if status.status is not current_status:
+            current_status = status.status
+            active_scene = scene_get(current_status, None)
+
+        frame = None
+        if active_scene is not None:
+            frame = active_scene.get_surface(current_status)
         # --
 
-        # Update display
-        pygame.display.flip()
+        # Only repaint and flip when there's a new frame to show; the
+        # display just keeps its last contents otherwise
+        if frame is not last_frame:
+            if frame is not None:
+                # Scene frames fill the whole screen, so a background
+                # fill underneath would just be overwritten
+                blit(frame, (0, 0))
+            else:
+                fill(WHITE)
+
+            # Update display
+            flip()
 
-        # print(clock.get_fps())
-        # clock.tick(60)
-        clock.tick(30)
+            # print(clock.get_fps())
+            # Full speed while things are changing
+            tick(60)
+        else:
+            # Idle along on repeats
+            tick(30)
+
+        last_frame = frame
 
         # -- Event loop
-        for event in pygame.event.get():
+        for event in event_get():
             # Mark current loop as last
-            if event.type == pygame.QUIT:
+            if event.type == QUIT:
                 playing = False
 
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+            elif event.type == KEYDOWN:
+                if event.key == K_SPACE:
                     active_scene.enemy.object.hp -= 1
 
                 if (
@@ -260,14 +334,11 @@ def main():
                     and active_scene.menu.object is not None
                 ):
                     active_menu = active_scene.menu.object
-                    if event.key == pygame.K_UP:
-                        active_menu.update_option(-1)
-
-                    elif event.key == pygame.K_DOWN:
-                        active_menu.update_option(1)
+                    if (delta := menu_delta.get(event.key)) is not None:
+                        active_menu.update_option(delta)
 
                     # K_RETURN is enter key
-                    elif event.key == pygame.K_RETURN:
+                    elif event.key == K_RETURN:
                         # Update status
                         new_option = active_menu.get_option()
                         status.update(
@@ -9,6 +9,7 @@ import fonts
 
 # Global imports. No bloat hehe
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any, Union
 from os.path import join as path_join
 from pygame import SRCALPHA
@@ -29,6 +30,9 @@ def nice_float(num: float) -> Union[int, float]:
 
 
 # This one is at the top because it's very important.
+SCREEN_SIZE: tuple[int, int] = (800, 600)
+
+
 def screen_size() -> tuple[int, int]:
     """
     This function will return the width and height for the pygame screen
@@ -38,7 +42,7 @@ def screen_size() -> tuple[int, int]:
     python does not support constants.
     :return: x, y tuple
     """
-    return 800, 600
+    return SCREEN_SIZE
 
 
 class GameStatus(Enum):
@@ -121,7 +125,7 @@ class Weapon:
         self.sprite = sprite
 
     def get_surface(self):
-        width, height = screen_size()
+        width, height = SCREEN_SIZE
         surface = pygame.Surface((width, height))
         surface.blit(
             self.sprite, (width - self.size[0], height - self.size[1])
@@ -135,6 +139,41 @@ class Item:
         self.mag = magnitude
 
 
+@lru_cache(maxsize=256)
+def _render_text_cached(font: Font, text: str, fg: tuple, bg) -> Surface:
+    return font.render(text, True, fg, bg)
+
+
+def render_text(font: Font, text: str, fg, bg=None) -> Surface:
+    """
+    Render text through a cache, so re-drawing the same string every
+    frame doesn't rasterize the font again. font.render is expensive!
+    :param font: Pygame font
+    :param text: Take a guess
+    :param fg: Text color
+    :param bg: Background color, or None for transparent
+    :return: Pygame surface (shared, don't draw on it)
+    """
+    # Colors are turned into plain tuples so the cache key is hashable
+    return _render_text_cached(
+        font, text, tuple(fg), tuple(bg) if bg is not None else None
+    )
+
+
+# pygame-ce ships Surface.fblits, a faster batch blit that never builds
+# the rect list; upstream pygame only has blits. Decided once at import
+# so the per-frame path doesn't pay for a hasattr.
+if hasattr(Surface, "fblits"):
+
+    def blit_batch(surface: Surface, batch) -> None:
+        surface.fblits(batch)
+
+else:
+
+    def blit_batch(surface: Surface, batch) -> None:
+        surface.blits(batch, doreturn=0)
+
+
 def draw_border(
     surface: Surface, thickness=5, color=colors.RGB.BLACK
 ) -> Surface:
@@ -198,8 +237,11 @@ class Menu:
         :keyword line_thickness: Thickness in px of line
         :keyword line_color: Color of line
         """
+        # Bumped whenever the menu changes, so scenes know when their
+        # cached surfaces are stale. Must exist before options is set.
+        self.version = 0
+
         # Parameters
-        self.options = options
         self.size = size
         self.font = font
 
@@ -221,28 +263,98 @@ class Menu:
         if self.line:
             self.padding += self.line_thickness
 
+        # Vertical distance between option rows. Font metrics never
+        # change, so ask for the linesize exactly once.
+        self._line_step = self.font.get_linesize() + self.text_offset
+
+        # get_surface cache, only rebuilt when version has moved
+        self._cached_surface = None
+        self._cached_version = -1
+
+        # Fill + background image don't change between rebuilds either,
+        # so they're composed once on first use and copied after that
+        self._base = None
+
+        # Per-pixel alpha only matters if something can show through:
+        # a translucent background colour or a background image.
+        # Opaque menus get the plain (faster to blit) surface.
+        self._needs_alpha = (
+            len(self.background_color) == 4
+            and self.background_color[3] != 255
+        ) or self.background_image is not None
+
         # Defaults
         # Start at first option
         self.current_option = 0
 
+        # Last so the fonts and colors the setter needs are in place
+        self.options = options
+
+    @property
+    def current_option(self) -> int:
+        return self._current_option
+
+    @current_option.setter
+    def current_option(self, new_option: int):
+        # A property so direct assignments (e.g. resetting to 0) count
+        # as changes too, not just update_option calls
+        self._current_option = new_option
+        self.version += 1
+
+    @property
+    def options(self) -> dict[str, Any]:
+        return self._options
+
+    @options.setter
+    def options(self, new_options: dict[str, Any]):
+        self._options = new_options
+        self.version += 1
+
+        # Indexable copies so get_option is a plain index instead of
+        # rebuilding a tuple of the values on every call
+        self._keys = list(new_options.keys())
+        self._values = list(new_options.values())
+        self._num_options = len(self._keys)
+
+        # The layout is fixed too, so work out where every option goes
+        # ahead of time. The line step leaves room so lines don't
+        # overlap.
+        line_step = self._line_step
+        self._positions = [
+            (self.padding, self.padding + idx * line_step)
+            for idx in range(len(new_options))
+        ]
+
+        # The labels never change between frames, so rasterize each one
+        # now, normal and selected, and only blit them in get_surface
+        self._rendered = [
+            (
+                self.font.render(
+                    label,
+                    self.antialias,
+                    self.text_color,
+                    self.text_background,
+                ),
+                self.font.render(
+                    label,
+                    self.antialias,
+                    self.text_color,
+                    self.text_selected,
+                ),
+            )
+            for label in new_options
+        ]
+
     def update_option(self, diff: int):
         """
         Changes the current option
         :param diff: Value to be added to the current option
         """
         # In case its empty
-        if self.options:
-
-            self.current_option += diff
-
-            # Wrap around should support changes of more than 1
-            num_options = len(self.options)
-
-            if self.current_option >= num_options:
-                self.current_option %= num_options
-
-            elif self.current_option < 0:
-                self.current_option = num_options - 1
+        if num_options := self._num_options:
+            # Python's modulo is always non-negative, so one operation
+            # wraps both directions, even for jumps of more than 1
+            self.current_option = (self.current_option + diff) % num_options
 
     def get_option(self) -> Any:
         """
@@ -250,7 +362,7 @@ class Menu:
         :return: Any
         """
         if self.options:
-            return tuple(self.options.values())[self.current_option]
+            return self._values[self.current_option]
 
     def get_surface(self) -> Surface:
         """
@@ -258,39 +370,50 @@ class Menu:
         surface
         :return: Pygame Surface
         """
-        # SRCALPHA needed to support RGBA colours. Slow.
-        surface = Surface(self.size, flags=SRCALPHA)
-        surface.fill(self.background_color)
-
-        if self.background_image is not None:
-            surface.blit(self.background_image, (0, 0))
-
-        # Offsets arent tuples so that they can be reassigned
-        # Padding from left
-        horizontal_offset = self.padding
-        # Padding from top
-        vertical_offset = self.padding
-
-        for idx, option in enumerate(self.options.keys()):
+        # Serve the cached surface while nothing changed
+        if (
+            self._cached_surface is not None
+            and self._cached_version == self.version
+        ):
+            return self._cached_surface
+
+        if self._base is None:
+            if self._needs_alpha:
+                # SRCALPHA needed to support RGBA colours. Slow.
+                base = Surface(self.size, flags=SRCALPHA)
+            else:
+                base = Surface(self.size).convert()
+            base.fill(self.background_color)
+
+            if self.background_image is not None:
+                base.blit(self.background_image, (0, 0))
+
+            self._base = base
+
+        # Rebuilds start from a copy of the static base, so fill and
+        # background only ever happen once
+        surface = self._base.copy()
+
+        # Positions were computed when the options were set, so drawing
+        # is a single batched call over the pre-rendered labels
+        batch = [
             # Display a different highlight if this option's the current one
-            text_bg = self.text_background
-
-            if idx == self.current_option:
-                text_bg = self.text_selected
-
-            text = self.font.render(
-                option, self.antialias, self.text_color, text_bg
+            (
+                selected if idx == self.current_option else normal,
+                self._positions[idx],
             )
-            surface.blit(text, (horizontal_offset, vertical_offset))
-
-            # get_linesize() should return recommended line size, this way text
-            # won't overlap
-            vertical_offset += self.font.get_linesize() + self.text_offset
+            for idx, (normal, selected) in enumerate(self._rendered)
+        ]
+        blit_batch(surface, batch)
 
         if self.line:
-            return draw_border(surface, self.line_thickness, self.line_color)
-        else:
-            return surface
+            surface = draw_border(
+                surface, self.line_thickness, self.line_color
+            )
+
+        self._cached_surface = surface
+        self._cached_version = self.version
+        return surface
 
 
 class TextBox:
@@ -334,6 +457,15 @@ class TextBox:
 
         self.padding = padding + (line_thickness if self.line else 0)
 
+        # Same deal as Menu.version, lets scenes cache their surfaces
+        self.version = 0
+        self._raw_text = text
+
+        # And same deal as Menu's surface cache: only build a new
+        # surface when the text has actually moved on
+        self._cached_surface = None
+        self._cached_version = -1
+
         if size is not None:
             self.size = size
             self.text = self.format_text(text)
@@ -347,7 +479,13 @@ class TextBox:
             self.text = [text]
 
     def set_text(self, new_text: str):
+        # Re-wrapping isn't free, skip it if nothing actually changed
+        if new_text == self._raw_text:
+            return
+
+        self._raw_text = new_text
         self.text = self.format_text(new_text)
+        self.version += 1
 
     def format_text(self, text) -> list[str]:
         # WIDTH is the number of chars each line can have. I'm just gonna use
@@ -389,24 +527,68 @@ class TextBox:
         :return: pygame surface
         """
 
+        if (
+            self._cached_surface is not None
+            and self._cached_version == self.version
+        ):
+            return self._cached_surface
+
         surface = Surface(self.size, flags=SRCALPHA)
         surface.fill(self.bg)
 
+        # None of these change between lines, so resolve them once
+        # instead of per iteration
+        font = self.font
+        fg = self.fg
+        padding = self.padding
+        linesize = font.get_linesize()
+        blit = surface.blit
+
         v_offset = 0
         for line in self.text:
-            surface.blit(
-                self.font.render(line, True, self.fg),
-                (self.padding, self.padding + v_offset),
+            blit(
+                render_text(font, line, fg),
+                (padding, padding + v_offset),
             )
-            v_offset += self.font.get_linesize()
+            v_offset += linesize
 
         if self.line:
-            return draw_border(surface, self.line_thickness, self.line_color)
-        else:
-            return surface
+            surface = draw_border(
+                surface, self.line_thickness, self.line_color
+            )
+
+        self._cached_surface = surface
+        self._cached_version = self.version
+        return surface
 
 
 class Enemy:
+    # Every attribute is known up front, so slots skip the per-instance
+    # __dict__ (and catch typo'd attribute writes for free)
+    __slots__ = (
+        "name",
+        "hp",
+        "max_hp",
+        "size",
+        "weakness",
+        "damage",
+        "sprites",
+        "_default_sprite_key",
+        "_healthbar_key",
+        "_healthbar_cache",
+        "_blank_sprite",
+        "_pending_sprites",
+    )
+
+    # Which sprite each status shows. Class-level so get_sprite doesn't
+    # rebuild the mapping on every call.
+    STATUS_SPRITES = {
+        GameStatus.BATTLE_START: "idle",
+        GameStatus.BATTLE_MENU: "idle",
+        GameStatus.PLAYER_ATTACK: "hurt",
+        GameStatus.ENEMY_ATTACK: "attack",
+    }
+
     def __init__(
         self,
         name: str,
@@ -433,10 +615,25 @@ class Enemy:
             "attack": None,
             "defeat": None,
         }
+        # What to fall back on for statuses without a mapping
+        self._default_sprite_key = next(iter(self.sprites))
+
+        # get_healthbar cache, the bar only changes when hp does
+        self._healthbar_key = None
+        self._healthbar_cache = None
+
+        # Lazily built stand-in for when no sprite loaded at all
+        self._blank_sprite = None
+
+        # (folder, sprites_dict) queued by load_sprites, loaded on the
+        # first get_sprite call instead of at startup
+        self._pending_sprites = None
 
     def load_sprites(self, folder: str, sprites_dict: dict = None) -> None:
         """
-        Load the sprites into this thing!
+        Note down where the sprites live. The actual files are only
+        read (and converted and scaled) the first time get_sprite asks,
+        so enemies the player never meets cost nothing.
         :param folder: A Folder containing idle.png
                                            hurt.png
                                            attack.png
@@ -445,11 +642,17 @@ class Enemy:
         if sprites_dict is None:
             sprites_dict = {key: f"{key}.png" for key in self.sprites.keys()}
 
+        self._pending_sprites = (folder, sprites_dict)
+
+    def _load_pending_sprites(self) -> None:
+        folder, sprites_dict = self._pending_sprites
+        self._pending_sprites = None
+
         for sprite in self.sprites.keys():
             try:
                 # Convert returns a faster to draw image.
                 tmp = image_load(
-                    f"{path_join(folder, sprites_dict[sprite])}"
+                    path_join(folder, sprites_dict[sprite])
                 ).convert()
 
                 # I like how images look with the black color key
@@ -478,28 +681,28 @@ class Enemy:
         :param status: GameStatus attribute
         :return: Pygame surface
         """
-        # Set which sprite to use
-        status_sprite = {
-            GameStatus.BATTLE_START: "idle",
-            GameStatus.BATTLE_MENU: "idle",
-            GameStatus.PLAYER_ATTACK: "hurt",
-            GameStatus.ENEMY_ATTACK: "attack",
-        }
-
-        surface = Surface(self.size, flags=SRCALPHA)
-        surface.fill(colors.RGBA.TRANSPARENT)
+        if self._pending_sprites is not None:
+            self._load_pending_sprites()
 
         # Get either the sprite for the given status
-        # or the first item as a fallback
-        sprite = self.sprites.get(status_sprite.get(status, None), None)
+        # or the default one as a fallback
+        key = self.STATUS_SPRITES.get(status, self._default_sprite_key)
+        sprite = self.sprites.get(key, None)
         if sprite is None:
-            sprite = tuple(self.sprites.values())[0]
+            sprite = self.sprites[self._default_sprite_key]
 
+        # Sprites are already scaled to self.size, so they can be
+        # handed out as-is instead of blitted onto a fresh surface
         if sprite is not None:
-            # noinspection PyTypeChecker
-            surface.blit(sprite, (0, 0))
+            return sprite
 
-        return surface
+        # Nothing loaded at all; keep a single transparent stand-in
+        # around so callers still get something blittable
+        if self._blank_sprite is None:
+            self._blank_sprite = Surface(self.size, flags=SRCALPHA)
+            self._blank_sprite.fill(colors.RGBA.TRANSPARENT)
+
+        return self._blank_sprite
 
     def get_healthbar(
         self,
@@ -520,8 +723,16 @@ class Enemy:
         :return: Pygame surface
         """
         if size is None:
-            width, height = screen_size()
-            size = (width // 2, height // 4.8)
+            width, height = SCREEN_SIZE
+            # Integer maths: height * 5 // 24 is height / 4.8 without
+            # producing a float that Surface would have to coerce
+            size = (width // 2, height * 5 // 24)
+
+        # Rebuilding the bar is renders + rects, so reuse the last one
+        # while the hp (and the styling) stays the same
+        key = (self.hp, size, padding, bg_color, text_color, bar_color)
+        if key == self._healthbar_key:
+            return self._healthbar_cache
 
         # No alpha, shouldn't be necessary
         surface = Surface(size)
@@ -529,12 +740,12 @@ class Enemy:
         linesize = fonts.HEALTHBAR.get_linesize()
 
         surface.blit(
-            fonts.HEALTHBAR.render(self.name.capitalize(), True, text_color),
+            render_text(fonts.HEALTHBAR, self.name.capitalize(), text_color),
             (padding, padding),
         )
         surface.blit(
-            fonts.HEALTHBAR.render(
-                f"{self.hp}/{self.max_hp} HP", True, text_color
+            render_text(
+                fonts.HEALTHBAR, f"{self.hp}/{self.max_hp} HP", text_color
             ),
             (padding, padding + linesize),
         )
@@ -562,7 +773,9 @@ class Enemy:
             ),
         )
 
-        return draw_border(surface)
+        self._healthbar_key = key
+        self._healthbar_cache = draw_border(surface)
+        return self._healthbar_cache
 
 
 # noinspection PyRedeclaration
@@ -583,6 +796,45 @@ class Player:
 
         self.items = items
 
+        # Menu option dicts built from the inventories, rebuilt only
+        # when the inventory changes (see use)
+        self._weapon_options = None
+        self._item_options = None
+
+    @property
+    def weapon_options(self) -> dict[str, Any]:
+        """
+        The weapon menu's options, Back included. The same dict object
+        comes back until the inventory changes, so callers can compare
+        identity to skip reassigning it.
+        :return: dict of label to weapon (or status for Back)
+        """
+        if self._weapon_options is None:
+            options = {
+                weapon.name: weapon
+                for weapon in self.weapons
+                if weapon is not None
+            }
+            options["Back"] = GameStatus.BATTLE_MENU
+            self._weapon_options = options
+
+        return self._weapon_options
+
+    @property
+    def item_options(self) -> dict[str, Any]:
+        """
+        Same as weapon_options but for consumables.
+        :return: dict of label to item (or status for Back)
+        """
+        if self._item_options is None:
+            options = {
+                item.name: item for item in self.items if item is not None
+            }
+            options["Back"] = GameStatus.BATTLE_MENU
+            self._item_options = options
+
+        return self._item_options
+
     def __str__(self):
         # ignore floating point precision errors
         nice_hp = nice_float(self.hp)
@@ -592,6 +844,8 @@ class Player:
     def use(self, item: Item):
         assert item in self.items, f"{item} not it self.items when used"
         self.items.remove(item)
+        # The inventory changed so the cached menu options are stale
+        self._item_options = None
         if item.type is ItemType.DEFENCE:
             self.defence += 1 * item.mag
 
@@ -4,7 +4,14 @@
 # Local imports
 import fonts
 import colors
-from game_objects import screen_size, GameStatus, Enemy, Menu, TextBox
+from game_objects import (
+    SCREEN_SIZE,
+    blit_batch,
+    GameStatus,
+    Enemy,
+    Menu,
+    TextBox,
+)
 
 # Global imports
 from dataclasses import dataclass
@@ -27,22 +34,60 @@ class Scene:
     menu: Printable
     statics: dict[Any, Printable]
 
+    def __post_init__(self):
+        # Composing a whole scene is expensive, so the result is kept
+        # around until one of the printables changes (see state_key)
+        self._cache: Union[Surface, None] = None
+        self._cache_key: Union[tuple, None] = None
+
+    def state_key(self, *args) -> tuple:
+        """
+        A tuple describing everything the composed surface depends on.
+        If it's equal between two frames, the cached surface is reused.
+        :return: tuple
+        """
+        return tuple(
+            None
+            if printable.object is None
+            else (id(printable.object), getattr(printable.object, "version", 0))
+            for printable in (self.menu, *self.statics.values())
+        )
+
     def get_surface(self, *args, **kwargs) -> Surface:
-        surface = Surface(screen_size())
+        key = self.state_key(*args)
+        if self._cache is not None and key == self._cache_key:
+            return self._cache
+
+        # The composed frame is blitted to the screen over and over, so
+        # match the display's pixel format once per rebuild and every
+        # one of those blits becomes a plain opaque copy
+        surface = self.compose(*args, **kwargs).convert()
+
+        self._cache = surface
+        self._cache_key = key
+        return surface
+
+    def compose(self, *args, **kwargs) -> Surface:
+        surface = Surface(SCREEN_SIZE)
         surface.fill(colors.RGB.WHITE)
 
+        batch = []
+
         # Add the background
         if self.bg is not None:
-            surface.blit(self.bg, (0, 0))
+            batch.append((self.bg, (0, 0)))
 
         # Put all the static objects first
         for static in self.statics.values():
             if static.object is not None:
-                surface.blit(static.object.get_surface(), static.pos)
+                batch.append((static.object.get_surface(), static.pos))
 
         # Then put the menu so that it's never covered
         if self.menu.object is not None:
-            surface.blit(self.menu.object.get_surface(), self.menu.pos)
+            batch.append((self.menu.object.get_surface(), self.menu.pos))
+
+        # A single C-level call beats one Python blit per surface
+        blit_batch(surface, batch)
 
         return surface
 
@@ -52,26 +97,61 @@ class BattleScene(Scene):
     enemy: Printable
     healthbar: Printable
 
-    def get_surface(self, status: GameStatus) -> Surface:
+    def state_key(self, *args) -> tuple:
+        # The sprite depends on the status and the healthbar on the hp,
+        # so both are part of the key
+        enemy = self.enemy.object
+        return super().state_key() + (
+            args[0] if args else None,
+            None if enemy is None else (id(enemy), enemy.hp),
+        )
+
+    def compose(self, status: GameStatus) -> Surface:
         """
         Same as Scene but with an enemy!
         :param status: Game status for sprite
         :return: surface
         """
-        surface = super().get_surface()
+        surface = super().compose()
 
-        surface.blit(self.enemy.object.get_sprite(status), self.enemy.pos)
+        batch = [(self.enemy.object.get_sprite(status), self.enemy.pos)]
 
-        # TODO: enemy method hp_changed. Only get healthbar if it has changed.
-        #       Will reduce calls.
         # Update healthbar and draw.
         if self.enemy.object is not None:
             self.healthbar.object = self.enemy.object.get_healthbar()
-            surface.blit(self.healthbar.object, self.healthbar.pos)
+            batch.append((self.healthbar.object, self.healthbar.pos))
+
+        blit_batch(surface, batch)
 
         return surface
 
 
+def compute_cover_size(
+    src_width: int, src_height: int, width: int, height: int
+) -> tuple[int, int]:
+    """
+    The size that scales a src_width x src_height image up just enough
+    for both sides to cover width x height, keeping its aspect ratio.
+    Pure integer maths, so it can be called for whole batches of sizes
+    without touching any surfaces.
+    :return: (new_width, new_height) tuple
+    """
+    # Cross-multiplied comparison picks the axis that has to grow the
+    # most without any float division
+    if src_width * height < src_height * width:
+        return width, src_height * width // src_width
+
+    return src_width * height // src_height, height
+
+
+# Scaling is O(width * height), so remember results in case the same
+# surface gets resized again (e.g. a scene being rebuilt).
+# Keyed by the Surface itself (they hash by identity), which also keeps
+# the source alive -- an id() key could be recycled by a later surface
+# after the original is garbage-collected and serve it a stale result.
+_resize_cache: dict[tuple[Surface, tuple[int, int]], Surface] = {}
+
+
 def resize_to_cover(source: Surface, size: tuple[int, int]) -> Surface:
     """
     Resizes a Surface so it the smallest side matches with the target size
@@ -79,24 +159,18 @@ def resize_to_cover(source: Surface, size: tuple[int, int]) -> Surface:
     :param size: (x, y)
     :return: Same pygame surface, scaled.
     """
-    # Resize source to fit
-    src_size = source.get_size()
+    cache_key = (source, size)
+    if (cached := _resize_cache.get(cache_key)) is not None:
+        return cached
 
-    # Get index of smallest side
-    smallest = 0 if src_size[0] < src_size[1] else 1
-
-    # Fill with place holders
-    new_src_size = [0, 0]
-
-    # Make smallest size of target
-    new_src_size[smallest] = size[smallest]
-
-    # Not 1 -> 0, Not 0 -> 1. Yeah. Calculate new size using ratio
-    new_src_size[not smallest] = round(
-        (new_src_size[smallest] / src_size[smallest]) * src_size[not smallest]
-    )
+    # Resize source to fit
+    new_src_size = compute_cover_size(*source.get_size(), *size)
 
-    return transform.scale(source, new_src_size)
+    # Backgrounds are scaled once and cached, so the nicer-looking
+    # smoothscale is worth its extra cost here
+    scaled = transform.smoothscale(source, new_src_size)
+    _resize_cache[cache_key] = scaled
+    return scaled
 
 
 def generate_scenes() -> dict[GameStatus, Scene]:
@@ -105,7 +179,7 @@ def generate_scenes() -> dict[GameStatus, Scene]:
     :return: Dict of game status to scene.
     """
     scenes = dict()
-    display_size = display_width, display_height = screen_size()
+    display_size = display_width, display_height = SCREEN_SIZE
 
     # Store these for easy access because they're reused a lot
     battle_scene_stuff = {
@@ -141,8 +215,11 @@ def generate_scenes() -> dict[GameStatus, Scene]:
     # ----------------
 
     scenes[GameStatus.TITLE_SCREEN] = Scene(
+        # convert() matches the display's pixel format, so every blit
+        # afterwards is a plain copy instead of a per-pixel conversion
         bg=resize_to_cover(
-            image.load(path.join("images", "titlescreen1.jpg")), display_size
+            image.load(path.join("images", "titlescreen1.jpg")).convert(),
+            display_size,
         ),
         menu=Printable(
             Menu(
@@ -174,7 +251,8 @@ def generate_scenes() -> dict[GameStatus, Scene]:
     # TODO: BGs could be set on game.py
     scenes[GameStatus.BATTLE_START] = BattleScene(
         bg=resize_to_cover(
-            image.load(path.join("images", "bgs", "dentist.jpg")), display_size
+            image.load(path.join("images", "bgs", "dentist.jpg")).convert(),
+            display_size,
         ),
         menu=Printable(None),
         statics={
@@ -351,4 +429,19 @@ def generate_scenes() -> dict[GameStatus, Scene]:
         healthbar=scenes[GameStatus.BATTLE_START].healthbar,
     )
 
+    # game.py's battle branches rely on these being BattleScenes.
+    # Checked once here at setup rather than with asserts every frame.
+    for battle_status in (
+        GameStatus.BATTLE_START,
+        GameStatus.BATTLE_MENU,
+        GameStatus.WEAPON_MENU,
+        GameStatus.ITEM_MENU,
+        GameStatus.PLAYER_ATTACK,
+        GameStatus.USE_ITEM,
+        GameStatus.ENEMY_ATTACK,
+    ):
+        assert isinstance(
+            scenes[battle_status], BattleScene
+        ), f"{battle_status} scene is {type(scenes[battle_status])}"
+
     return scenes